@@ -83,7 +83,7 @@ class BaseActor(Actor):
         """
         Get the catalog as a list of ToolDefinitions.
         """
-        return [tool.definition for tool in self.catalog]
+        return [tool.definition for tool in self.catalog.tools.values()]
 
     def register_tool(self, tool: Callable, toolkit_name: str) -> None:
         """
@@ -175,7 +175,7 @@ class BaseActor(Actor):
         """
         Provide a health check that serves as a heartbeat of actor health.
         """
-        return {"status": "ok", "tool_count": len(self.catalog)}
+        return {"status": "ok", "tool_count": len(self.catalog.tools)}
 
     def register_routes(self, router: Router) -> None:
         """
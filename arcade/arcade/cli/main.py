@@ -180,7 +180,7 @@ def show(
     try:
         if local:
             catalog = create_cli_catalog(toolkit=toolkit)
-            tools = [t.definition for t in list(catalog)]
+            tools = [t.definition for t in catalog.tools.values()]
         else:
             tools = get_tools_from_engine(host, port, force_tls, force_no_tls, toolkit)
 
@@ -1,8 +1,7 @@
-import asyncio
 import inspect
 import typing
 from collections.abc import Iterator
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from importlib import import_module
@@ -52,6 +51,25 @@ from arcade.core.utils import (
 InnerWireType = Literal["string", "integer", "number", "boolean", "json"]
 WireType = Union[InnerWireType, Literal["array"]]
 
+# Shared models for tools that take no inputs or have no return annotation
+_EMPTY_INPUT_MODEL = create_model("EmptyInput")
+_EMPTY_OUTPUT_MODEL = create_model("EmptyOutput")
+
+# Mapping between Python types and HTTP/JSON types
+_WIRE_TYPE_MAP: dict[type, WireType] = {
+    str: "string",
+    bool: "boolean",
+    int: "integer",
+    float: "number",
+    dict: "json",
+}
+
+# Mapping between the origin of generic types (e.g. list[str]) and HTTP/JSON types
+_OUTER_WIRE_TYPE_MAP: dict[type, WireType] = {
+    list: "array",
+    dict: "json",
+}
+
 
 @dataclass
 class WireTypeInfo:
@@ -64,7 +82,8 @@ class WireTypeInfo:
     enum_values: list[str] | None = None
 
 
-class ToolMeta(BaseModel):
+@dataclass(slots=True, frozen=True)
+class ToolMeta:
     """
     Metadata for a tool once it's been materialized.
     """
@@ -73,11 +92,12 @@ class ToolMeta(BaseModel):
     toolkit: Optional[str] = None
     package: Optional[str] = None
     path: Optional[str] = None
-    date_added: datetime = Field(default_factory=datetime.now)
-    date_updated: datetime = Field(default_factory=datetime.now)
+    date_added: datetime = field(default_factory=datetime.now)
+    date_updated: datetime = field(default_factory=datetime.now)
 
 
-class MaterializedTool(BaseModel):
+@dataclass(slots=True, frozen=True)
+class MaterializedTool:
     """
     Data structure that holds tool information while stored in the Catalog
     """
@@ -107,10 +127,19 @@ class MaterializedTool(BaseModel):
         return self.definition.requirements.authorization is not None
 
 
-class ToolCatalog(BaseModel):
+class ToolCatalog:
     """Singleton class that holds all tools for a given actor"""
 
-    _tools: dict[FullyQualifiedName, MaterializedTool] = {}
+    __slots__ = ("_tools_by_name", "tools")
+
+    def __init__(self) -> None:
+        # Tools by fully-qualified name. Read it directly for fast lookups,
+        # but only add tools through add_tool() so the index below stays in sync
+        self.tools: dict[FullyQualifiedName, MaterializedTool] = {}
+
+        # Index of tools by their version-less fully-qualified name,
+        # so that lookups without a version don't need to scan every tool
+        self._tools_by_name: dict[FullyQualifiedName, MaterializedTool] = {}
 
     def add_tool(
         self,
@@ -122,7 +151,7 @@ class ToolCatalog(BaseModel):
         Add a function to the catalog as a tool.
         """
 
-        input_model, output_model = create_func_models(tool_func)
+        inputs, output, input_model, output_model = _analyze_tool(tool_func)
 
         if isinstance(toolkit_or_name, Toolkit):
             toolkit = toolkit_or_name
@@ -139,14 +168,16 @@ class ToolCatalog(BaseModel):
             toolkit_name,
             toolkit.version if toolkit else None,
             toolkit.description if toolkit else None,
+            inputs=inputs,
+            output=output,
         )
 
         fully_qualified_name = definition.get_fully_qualified_name()
 
-        if fully_qualified_name in self._tools:
+        if fully_qualified_name in self.tools:
             raise KeyError(f"Tool '{definition.name}' already exists in the catalog.")
 
-        self._tools[fully_qualified_name] = MaterializedTool(
+        materialized_tool = MaterializedTool(
             definition=definition,
             tool=tool_func,
             meta=ToolMeta(
@@ -158,6 +189,8 @@ class ToolCatalog(BaseModel):
             input_model=input_model,
             output_model=output_model,
         )
+        self.tools[fully_qualified_name] = materialized_tool
+        self._tools_by_name.setdefault(_without_version(fully_qualified_name), materialized_tool)
 
     def add_module(self, module: ModuleType) -> None:
         """
@@ -172,9 +205,16 @@ class ToolCatalog(BaseModel):
         """
 
         for module_name, tool_names in toolkit.tools.items():
+            if not tool_names:
+                continue
+
+            try:
+                module = import_module(module_name)
+            except ImportError as e:
+                raise ToolDefinitionError(f"Could not import module {module_name}. Reason: {e}")
+
             for tool_name in tool_names:
                 try:
-                    module = import_module(module_name)
                     tool_func = getattr(module, tool_name)
                     self.add_tool(tool_func, toolkit, module)
 
@@ -182,8 +222,6 @@ class ToolCatalog(BaseModel):
                     raise ToolDefinitionError(
                         f"Could not find tool {tool_name} in module {module_name}"
                     )
-                except ImportError as e:
-                    raise ToolDefinitionError(f"Could not import module {module_name}. Reason: {e}")
                 except TypeError as e:
                     raise ToolDefinitionError(
                         f"Type error encountered while adding tool {tool_name} from {module_name}. Reason: {e}"
@@ -193,25 +231,25 @@ class ToolCatalog(BaseModel):
         return self.get_tool(name)
 
     def __contains__(self, name: FullyQualifiedName) -> bool:
-        return name in self._tools
+        return name in self.tools
 
-    def __iter__(self) -> Iterator[MaterializedTool]:  # type: ignore[override]
-        yield from self._tools.values()
+    def __iter__(self) -> Iterator[MaterializedTool]:
+        return iter(self.tools.values())
 
     def __len__(self) -> int:
-        return len(self._tools)
+        return len(self.tools)
 
     def is_empty(self) -> bool:
-        return len(self._tools) == 0
+        return not self.tools
 
     def get_tool_names(self) -> list[FullyQualifiedName]:
-        return [tool.definition.get_fully_qualified_name() for tool in self._tools.values()]
+        return list(self.tools)
 
     def find_tool_by_func(self, func: Callable) -> ToolDefinition:
         """
         Find a tool by its function.
         """
-        for _, tool in self._tools.items():
+        for tool in self.tools.values():
             if tool.tool == func:
                 return tool.definition
         raise ValueError(f"Tool {func} not found in the catalog.")
@@ -242,7 +280,7 @@ class ToolCatalog(BaseModel):
             # No toolkit name provided, search tools with matching tool name
             matching_tools = [
                 tool
-                for fq_name, tool in self._tools.items()
+                for fq_name, tool in self.tools.items()
                 if fq_name.name.lower() == name.lower()
                 and (
                     version is None
@@ -261,15 +299,14 @@ class ToolCatalog(BaseModel):
         """
         if name.toolkit_version:
             try:
-                return self._tools[name]
+                return self.tools[name]
             except KeyError:
                 raise ValueError(f"Tool {name}@{name.toolkit_version} not found in the catalog.")
 
-        for key, tool in self._tools.items():
-            if key.equals_ignoring_version(name):
-                return tool
-
-        raise ValueError(f"Tool {name} not found.")
+        try:
+            return self._tools_by_name[_without_version(name)]
+        except KeyError:
+            raise ValueError(f"Tool {name} not found.")
 
     @staticmethod
     def create_tool_definition(
@@ -277,11 +314,15 @@ class ToolCatalog(BaseModel):
         toolkit_name: str,
         toolkit_version: Optional[str] = None,
         toolkit_desc: Optional[str] = None,
+        inputs: Optional[ToolInputs] = None,
+        output: Optional[ToolOutput] = None,
     ) -> ToolDefinition:
         """
-        Given a tool function, create a ToolDefinition
-        """
+        Given a tool function, create a ToolDefinition.
 
+        The inputs and output definitions are computed from the function
+        if they are not provided (or precomputed by the @tool decorator).
+        """
         raw_tool_name = getattr(tool, "__tool_name__", tool.__name__)
 
         # Hard requirement: tools must have descriptions
@@ -290,7 +331,8 @@ class ToolCatalog(BaseModel):
             raise ToolDefinitionError(f"Tool {raw_tool_name} is missing a description")
 
         # If the function returns a value, it must have a type annotation
-        if does_function_return_value(tool) and tool.__annotations__.get("return") is None:
+        # (check the annotation first: reading and parsing the source is much slower)
+        if tool.__annotations__.get("return") is None and does_function_return_value(tool):
             raise ToolDefinitionError(f"Tool {raw_tool_name} must have a return type annotation")
 
         auth_requirement = getattr(tool, "__tool_requires_auth__", None)
@@ -312,27 +354,124 @@ class ToolCatalog(BaseModel):
         tool_name = snake_to_pascal_case(raw_tool_name)
         fully_qualified_name = FullyQualifiedName.from_toolkit(tool_name, toolkit_definition)
 
+        # Tools decorated with @tool have their inputs and output computed at decoration time
+        if inputs is None:
+            inputs = getattr(tool, "__tool_inputs__", None)
+        if output is None:
+            output = getattr(tool, "__tool_output__", None)
+        if inputs is None or output is None:
+            signature = get_signature(tool)
+            inputs = create_input_definition(tool, signature)
+            output = create_output_definition(tool, signature)
+
         return ToolDefinition(
             name=tool_name,
             fully_qualified_name=str(fully_qualified_name),
             description=tool_description,
             toolkit=toolkit_definition,
-            inputs=create_input_definition(tool),
-            output=create_output_definition(tool),
+            inputs=inputs,
+            output=output,
             requirements=ToolRequirements(
                 authorization=auth_requirement,
             ),
         )
 
 
-def create_input_definition(func: Callable) -> ToolInputs:
+def _without_version(name: FullyQualifiedName) -> FullyQualifiedName:
     """
-    Create an input model for a function based on its parameters.
+    Get the version-less form of a fully-qualified tool name.
     """
+    if name.toolkit_version is None:
+        return name
+    return FullyQualifiedName(name=name.name, toolkit_name=name.toolkit_name)
+
+
+def get_signature(func: Callable) -> inspect.Signature:
+    """
+    Get the signature of a function, following any wrappers (such as the @tool decorator).
+    """
+    signature = getattr(func, "__tool_signature__", None)
+    if isinstance(signature, inspect.Signature):
+        return signature
+    return inspect.signature(func, follow_wrapped=True)
+
+
+def precompute_tool_metadata(func: Callable) -> None:
+    """
+    Compute the signature, input/output definitions, and input/output models of a tool function
+    and store them on the function, so that adding it to a catalog doesn't need to inspect it again.
+
+    If the function is not a valid tool, only the signature is stored. The full error is raised
+    later, when the tool is added to a catalog.
+    """
+    signature = inspect.signature(func, follow_wrapped=True)
+    func.__tool_signature__ = signature  # type: ignore[attr-defined]
+
+    try:
+        inputs, output, input_model, output_model = _analyze_tool(func, signature)
+    except Exception:
+        return
+
+    func.__tool_inputs__ = inputs  # type: ignore[attr-defined]
+    func.__tool_output__ = output  # type: ignore[attr-defined]
+    func.__tool_input_model__ = input_model  # type: ignore[attr-defined]
+    func.__tool_output_model__ = output_model  # type: ignore[attr-defined]
+
+
+def _analyze_tool(
+    func: Callable, signature: Optional[inspect.Signature] = None
+) -> tuple[ToolInputs, ToolOutput, type[BaseModel], type[BaseModel]]:
+    """
+    Create the input and output definitions and models for a tool function,
+    walking its parameters only once.
+    Returns the values precomputed by the @tool decorator, if present.
+    """
+    inputs = getattr(func, "__tool_inputs__", None)
+    output = getattr(func, "__tool_output__", None)
+    input_model = getattr(func, "__tool_input_model__", None)
+    output_model = getattr(func, "__tool_output_model__", None)
+    if (
+        isinstance(inputs, ToolInputs)
+        and isinstance(output, ToolOutput)
+        and input_model is not None
+        and output_model is not None
+    ):
+        return inputs, output, input_model, output_model
+
+    if signature is None:
+        signature = get_signature(func)
+
     input_parameters = []
+    input_fields = {}
+    tool_context_param_name = _get_tool_context_param_name(func, signature)
+
+    for name, param in signature.parameters.items():
+        if name == tool_context_param_name:
+            continue
+
+        tool_field_info = extract_field_info(param)
+        input_parameters.append(_create_input_parameter(tool_field_info))
+        input_fields[name] = _create_input_field(tool_field_info)
+
+    inputs = ToolInputs(
+        parameters=input_parameters, tool_context_parameter_name=tool_context_param_name
+    )
+    output = create_output_definition(func, signature)
+
+    pascal_name = snake_to_pascal_case(func.__name__)
+    input_model = _create_input_model(pascal_name, input_fields)
+    output_model = determine_output_model(func, signature, pascal_name=pascal_name)
+
+    return inputs, output, input_model, output_model
+
+
+def _get_tool_context_param_name(func: Callable, signature: inspect.Signature) -> str | None:
+    """
+    Get the name of the ToolContext parameter of a function, if it has one.
+    """
     tool_context_param_name: str | None = None
 
-    for _, param in inspect.signature(func, follow_wrapped=True).parameters.items():
+    for param in signature.parameters.values():
         if param.annotation is ToolContext:
             if tool_context_param_name is not None:
                 raise ToolDefinitionError(
@@ -340,39 +479,85 @@ def create_input_definition(func: Callable) -> ToolInputs:
                 )
 
             tool_context_param_name = param.name
-            continue  # No further processing of this param (don't add it to the list of inputs)
 
-        tool_field_info = extract_field_info(param)
+    return tool_context_param_name
 
-        # If the field has a default value, it is not required
-        # If the field is optional, it is not required
-        has_default_value = tool_field_info.default is not None
-        is_required = not tool_field_info.is_optional and not has_default_value
-
-        input_parameters.append(
-            InputParameter(
-                name=tool_field_info.name,
-                description=tool_field_info.description,
-                required=is_required,
-                inferrable=tool_field_info.is_inferrable,
-                value_schema=ValueSchema(
-                    val_type=tool_field_info.wire_type_info.wire_type,
-                    inner_val_type=tool_field_info.wire_type_info.inner_wire_type,
-                    enum=tool_field_info.wire_type_info.enum_values,
-                ),
-            )
-        )
+
+def _create_input_parameter(tool_field_info: "ToolParamInfo") -> InputParameter:
+    """
+    Create an input parameter definition from a tool parameter.
+    """
+    # If the field has a default value, it is not required
+    # If the field is optional, it is not required
+    has_default_value = tool_field_info.default is not None
+    is_required = not tool_field_info.is_optional and not has_default_value
+
+    return InputParameter(
+        name=tool_field_info.name,
+        description=tool_field_info.description,
+        required=is_required,
+        inferrable=tool_field_info.is_inferrable,
+        value_schema=ValueSchema(
+            val_type=tool_field_info.wire_type_info.wire_type,
+            inner_val_type=tool_field_info.wire_type_info.inner_wire_type,
+            enum=tool_field_info.wire_type_info.enum_values,
+        ),
+    )
+
+
+def _create_input_field(tool_field_info: "ToolParamInfo") -> tuple[type, Any]:
+    """
+    Create a Pydantic field definition (for create_model) from a tool parameter.
+    """
+    return (
+        tool_field_info.field_type,
+        Field(default=tool_field_info.default, description=tool_field_info.description),
+    )
+
+
+def _create_input_model(pascal_name: str, input_fields: dict[str, Any]) -> type[BaseModel]:
+    """
+    Create the Pydantic input model for a tool from its field definitions.
+    """
+    if not input_fields:
+        # A model without fields accepts (and ignores) any input, so it can be shared
+        return _EMPTY_INPUT_MODEL
+    return create_model(f"{pascal_name}Input", **input_fields)
+
+
+def create_input_definition(
+    func: Callable, signature: Optional[inspect.Signature] = None
+) -> ToolInputs:
+    """
+    Create an input model for a function based on its parameters.
+    """
+    if signature is None:
+        signature = get_signature(func)
+
+    tool_context_param_name = _get_tool_context_param_name(func, signature)
+
+    input_parameters = [
+        _create_input_parameter(extract_field_info(param))
+        for name, param in signature.parameters.items()
+        # No further processing of the context param (don't add it to the list of inputs)
+        if name != tool_context_param_name
+    ]
 
     return ToolInputs(
         parameters=input_parameters, tool_context_parameter_name=tool_context_param_name
     )
 
 
-def create_output_definition(func: Callable) -> ToolOutput:
+def create_output_definition(
+    func: Callable, signature: Optional[inspect.Signature] = None
+) -> ToolOutput:
     """
     Create an output model for a function based on its return annotation.
     """
-    return_type = inspect.signature(func, follow_wrapped=True).return_annotation
+    if signature is None:
+        signature = get_signature(func)
+
+    return_type = signature.return_annotation
     description = "No description provided."
 
     if return_type is inspect.Signature.empty:
@@ -382,15 +567,21 @@ def create_output_definition(func: Callable) -> ToolOutput:
             available_modes=["null"],
         )
 
+    # Fast path for simple return types (like str)
+    wire_type = _WIRE_TYPE_MAP.get(return_type) if isinstance(return_type, type) else None
+    if wire_type is not None:
+        return ToolOutput(
+            description=description,
+            available_modes=["value", "error"],
+            value_schema=ValueSchema(val_type=wire_type),
+        )
+
     if hasattr(return_type, "__metadata__"):
         description = return_type.__metadata__[0] if return_type.__metadata__ else None  # type: ignore[assignment]
         return_type = return_type.__origin__
 
     # Unwrap Optional types
-    is_optional = False
-    if get_origin(return_type) is Union and type(None) in get_args(return_type):
-        return_type = next(arg for arg in get_args(return_type) if arg is not type(None))
-        is_optional = True
+    return_type, is_optional = _unwrap_optional(return_type)
 
     wire_type_info = get_wire_type_info(return_type)
 
@@ -466,13 +657,20 @@ def extract_field_info(param: inspect.Parameter) -> ToolParamInfo:
     if annotation == inspect.Parameter.empty:
         raise ToolDefinitionError(f"Parameter {param} has no type annotation.")
 
+    # If the param is Annotated[], unwrap the annotation to get the "real" type
+    # Otherwise, use the literal type
+    metadata: tuple[Any, ...] = ()
+    original_type = annotation
+    if get_origin(annotation) is Annotated:
+        original_type, *_ = get_args(annotation)
+        metadata = annotation.__metadata__
+
     # Get the majority of the param info from either the Pydantic Field() or regular inspection
     if isinstance(param.default, FieldInfo):
-        param_info = extract_pydantic_param_info(param)
+        param_info = extract_pydantic_param_info(param, original_type)
     else:
-        param_info = extract_python_param_info(param)
+        param_info = extract_python_param_info(param, original_type)
 
-    metadata = getattr(annotation, "__metadata__", [])
     str_annotations = [m for m in metadata if isinstance(m, str)]
 
     # Get the description from annotations, if present
@@ -489,7 +687,7 @@ def extract_field_info(param: inspect.Parameter) -> ToolParamInfo:
         )
 
     # Get the Inferrable annotation, if it exists
-    inferrable_annotation = first_or_none(Inferrable, get_args(annotation))
+    inferrable_annotation = first_or_none(Inferrable, metadata)
 
     # Params are inferrable by default
     is_inferrable = inferrable_annotation.value if inferrable_annotation else True
@@ -546,27 +744,14 @@ def get_wire_type_info(_type: type) -> WireTypeInfo:
     return WireTypeInfo(wire_type, inner_wire_type, enum_values if is_enum else None)
 
 
-def extract_python_param_info(param: inspect.Parameter) -> ParamInfo:
-    # If the param is Annotated[], unwrap the annotation to get the "real" type
-    # Otherwise, use the literal type
-    annotation = param.annotation
-    original_type = annotation.__args__[0] if get_origin(annotation) is Annotated else annotation
-    field_type = original_type
-
+def extract_python_param_info(param: inspect.Parameter, original_type: type) -> ParamInfo:
     # Handle optional types
     # Both Optional[T] and T | None are supported
-    is_optional = False
-    if (
-        is_union(field_type)
-        and len(get_args(field_type)) == 2
-        and type(None) in get_args(field_type)
-    ):
-        field_type = next(arg for arg in get_args(field_type) if arg is not type(None))
-        is_optional = True
+    field_type, is_optional = _unwrap_optional(original_type)
 
     # Union types are not currently supported
     # (other than optional, which is handled above)
-    if is_union(field_type):
+    if is_union(field_type) or (is_optional and len(get_args(original_type)) > 2):
         raise ToolDefinitionError(
             f"Parameter {param.name} is a union type. Only optional types are supported."
         )
@@ -580,7 +765,7 @@ def extract_python_param_info(param: inspect.Parameter) -> ParamInfo:
     )
 
 
-def extract_pydantic_param_info(param: inspect.Parameter) -> ParamInfo:
+def extract_pydantic_param_info(param: inspect.Parameter, original_type: type) -> ParamInfo:
     default_value = None if param.default.default is PydanticUndefined else param.default.default
 
     if param.default.default_factory is not None:
@@ -589,20 +774,8 @@ def extract_pydantic_param_info(param: inspect.Parameter) -> ParamInfo:
         else:
             raise ToolDefinitionError(f"Default factory for parameter {param} is not callable.")
 
-    # If the param is Annotated[], unwrap the annotation to get the "real" type
-    # Otherwise, use the literal type
-    original_type = (
-        param.annotation.__args__[0]
-        if get_origin(param.annotation) is Annotated
-        else param.annotation
-    )
-    field_type = original_type
-
     # Unwrap Optional types
-    is_optional = False
-    if get_origin(field_type) is Union and type(None) in get_args(field_type):
-        field_type = next(arg for arg in get_args(field_type) if arg is not type(None))
-        is_optional = True
+    field_type, is_optional = _unwrap_optional(original_type)
 
     return ParamInfo(
         name=param.name,
@@ -614,6 +787,21 @@ def extract_pydantic_param_info(param: inspect.Parameter) -> ParamInfo:
     )
 
 
+def _unwrap_optional(_type: type) -> tuple[type, bool]:
+    """
+    Unwrap an optional type (Optional[T] or T | None) to its first non-None type.
+    Returns the unwrapped type and whether the type was optional.
+    """
+    if not is_union(_type):
+        return _type, False
+
+    args = get_args(_type)
+    if type(None) not in args:
+        return _type, False
+
+    return next(arg for arg in args if arg is not type(None)), True
+
+
 def get_wire_type(
     _type: type,
 ) -> WireType:
@@ -621,25 +809,13 @@ def get_wire_type(
     Mapping between Python types and HTTP/JSON types
     """
     # TODO ensure Any is not allowed
-    type_mapping: dict[type, WireType] = {
-        str: "string",
-        bool: "boolean",
-        int: "integer",
-        float: "number",
-        dict: "json",
-    }
-
-    outer_type_mapping: dict[type, WireType] = {
-        list: "array",
-        dict: "json",
-    }
-    wire_type = type_mapping.get(_type)
-    if wire_type:
+    wire_type = _WIRE_TYPE_MAP.get(_type)
+    if wire_type is not None:
         return wire_type
 
     if hasattr(_type, "__origin__"):
-        wire_type = outer_type_mapping.get(cast(type, get_origin(_type)))
-        if wire_type:
+        wire_type = _OUTER_WIRE_TYPE_MAP.get(cast(type, get_origin(_type)))
+        if wire_type is not None:
             return wire_type
 
     if issubclass(_type, Enum):
@@ -651,43 +827,52 @@ def get_wire_type(
     raise ToolDefinitionError(f"Unsupported parameter type: {_type}")
 
 
-def create_func_models(func: Callable) -> tuple[type[BaseModel], type[BaseModel]]:
+def create_func_models(
+    func: Callable, signature: Optional[inspect.Signature] = None
+) -> tuple[type[BaseModel], type[BaseModel]]:
     """
     Analyze a function to create corresponding Pydantic models for its input and output.
     """
     input_fields = {}
     # TODO figure this out (Sam)
-    if asyncio.iscoroutinefunction(func) and hasattr(func, "__wrapped__"):
+    if inspect.iscoroutinefunction(func) and hasattr(func, "__wrapped__"):
         func = func.__wrapped__
-    for name, param in inspect.signature(func, follow_wrapped=True).parameters.items():
+    if signature is None:
+        signature = get_signature(func)
+
+    for name, param in signature.parameters.items():
         # Skip ToolContext parameters
         if param.annotation is ToolContext:
             continue
 
-        # TODO make this cleaner
-        tool_field_info = extract_field_info(param)
-        param_fields = {
-            "default": tool_field_info.default,
-            "description": tool_field_info.description,
-            # TODO more here?
-        }
-        input_fields[name] = (tool_field_info.field_type, Field(**param_fields))
+        input_fields[name] = _create_input_field(extract_field_info(param))
 
-    input_model = create_model(f"{snake_to_pascal_case(func.__name__)}Input", **input_fields)  # type: ignore[call-overload]
+    pascal_name = snake_to_pascal_case(func.__name__)
+    input_model = _create_input_model(pascal_name, input_fields)
 
-    output_model = determine_output_model(func)
+    output_model = determine_output_model(func, signature, pascal_name=pascal_name)
 
     return input_model, output_model
 
 
-def determine_output_model(func: Callable) -> type[BaseModel]:
+def determine_output_model(
+    func: Callable,
+    signature: Optional[inspect.Signature] = None,
+    pascal_name: Optional[str] = None,
+) -> type[BaseModel]:
     """
     Determine the output model for a function based on its return annotation.
     """
-    return_annotation = inspect.signature(func).return_annotation
-    output_model_name = f"{snake_to_pascal_case(func.__name__)}Output"
+    if signature is None:
+        signature = get_signature(func)
+    if pascal_name is None:
+        pascal_name = snake_to_pascal_case(func.__name__)
+
+    return_annotation = signature.return_annotation
+    output_model_name = f"{pascal_name}Output"
     if return_annotation is inspect.Signature.empty:
-        return create_model(output_model_name)
+        # A model without fields accepts (and ignores) any output, so it can be shared
+        return _EMPTY_OUTPUT_MODEL
     elif hasattr(return_annotation, "__origin__"):
         if hasattr(return_annotation, "__metadata__"):
             field_type = return_annotation.__args__[0]
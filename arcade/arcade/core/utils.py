@@ -1,4 +1,5 @@
 import ast
+import functools
 import inspect
 import re
 from collections.abc import Iterable
@@ -26,6 +27,7 @@ def pascal_to_snake_case(name: str) -> str:
     return re.sub("([a-z0-9])([A-Z])", r"\1_\2", name).lower()
 
 
+@functools.lru_cache(maxsize=4096)
 def snake_to_pascal_case(name: str) -> str:
     """
     Converts a snake_case name to PascalCase.
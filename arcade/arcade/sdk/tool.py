@@ -2,6 +2,7 @@ import functools
 import inspect
 from typing import Any, Callable, TypeVar, Union
 
+from arcade.core.catalog import precompute_tool_metadata
 from arcade.core.utils import snake_to_pascal_case
 from arcade.sdk.auth import ToolAuthorization
 from arcade.sdk.errors import ToolExecutionError
@@ -23,6 +24,9 @@ def tool(
         func.__tool_description__ = desc or inspect.cleandoc(func.__doc__ or "")  # type: ignore[attr-defined]
         func.__tool_requires_auth__ = requires_auth  # type: ignore[attr-defined]
 
+        # Inspect the function once, here, instead of every time it's added to a catalog
+        precompute_tool_metadata(func)
+
         if inspect.iscoroutinefunction(func):
 
             @functools.wraps(func)
@@ -1,11 +1,15 @@
+import inspect
+from importlib import import_module
+from typing import Annotated
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from arcade.core.catalog import ToolCatalog
+from arcade.core.catalog import ToolCatalog, extract_field_info
 from arcade.core.errors import ToolDefinitionError
-from arcade.core.schema import FullyQualifiedName
+from arcade.core.schema import FullyQualifiedName, ToolContext
 from arcade.core.toolkit import Toolkit
+from arcade.core.utils import does_function_return_value
 from arcade.sdk import tool
 
 
@@ -136,3 +140,128 @@ def test_get_tool_by_name_with_invalid_version():
 
     with pytest.raises(ValueError):
         catalog.get_tool_by_name("SampleToolkit.SampleTool", version="2.0.0")
+
+
+def undecorated_tool() -> str:
+    return "Hello, world!"
+
+
+undecorated_tool.__tool_description__ = "An undecorated tool function"
+
+
+def undecorated_tool_with_params(
+    context: ToolContext, a: Annotated[int, "First number"], b: Annotated[int, "Second number"]
+) -> int:
+    return a + b
+
+
+undecorated_tool_with_params.__tool_description__ = "An undecorated tool function with params"
+
+
+def test_add_tool_inspects_signature_once():
+    catalog = ToolCatalog()
+
+    with patch("arcade.core.catalog.inspect.signature", wraps=inspect.signature) as mock_signature:
+        catalog.add_tool(undecorated_tool, "sample_toolkit")
+
+    assert mock_signature.call_count == 1
+
+
+def test_add_decorated_tool_uses_precomputed_metadata():
+    catalog = ToolCatalog()
+
+    with patch("arcade.core.catalog.inspect.signature", wraps=inspect.signature) as mock_signature:
+        catalog.add_tool(sample_tool, "sample_toolkit")
+
+    assert mock_signature.call_count == 0
+
+    materialized_tool = catalog.get_tool(FullyQualifiedName("SampleTool", "SampleToolkit", None))
+    assert materialized_tool.input_model is sample_tool.__tool_input_model__
+    assert materialized_tool.output_model is sample_tool.__tool_output_model__
+    assert materialized_tool.definition.output == sample_tool.__tool_output__
+
+
+def test_get_tool_without_version_returns_first_added_version():
+    catalog = ToolCatalog()
+    for version in ["1.0.0", "2.0.0"]:
+        toolkit = Toolkit(
+            name="sample_toolkit",
+            description="A sample toolkit",
+            version=version,
+            package_name="sample_toolkit",
+        )
+        catalog.add_tool(sample_tool, toolkit)
+
+    tool = catalog.get_tool(FullyQualifiedName("sampletool", "sampletoolkit", None))
+    assert tool.version == "1.0.0"
+
+    tool = catalog.get_tool(FullyQualifiedName("SampleTool", "SampleToolkit", "2.0.0"))
+    assert tool.version == "2.0.0"
+
+    with pytest.raises(ValueError):
+        catalog.get_tool(FullyQualifiedName("OtherTool", "SampleToolkit", None))
+
+
+def test_add_tool_extracts_each_param_once():
+    catalog = ToolCatalog()
+
+    with patch(
+        "arcade.core.catalog.extract_field_info", wraps=extract_field_info
+    ) as mock_extract_field_info:
+        catalog.add_tool(undecorated_tool_with_params, "sample_toolkit")
+
+    assert mock_extract_field_info.call_count == 2
+
+    tool = catalog.get_tool(FullyQualifiedName("UndecoratedToolWithParams", "SampleToolkit"))
+    assert [p.name for p in tool.definition.inputs.parameters] == ["a", "b"]
+    assert tool.definition.inputs.tool_context_parameter_name == "context"
+    assert list(tool.input_model.model_fields) == ["a", "b"]
+
+
+@tool
+def tool_without_inputs():
+    """A tool without inputs or output"""
+
+
+@tool
+def tool_with_only_context(context: ToolContext):
+    """Another tool without inputs or output"""
+
+
+def test_tools_without_inputs_or_output_share_empty_models():
+    catalog = ToolCatalog()
+    catalog.add_tool(tool_without_inputs, "sample_toolkit")
+    catalog.add_tool(tool_with_only_context, "sample_toolkit")
+
+    first = catalog.get_tool(FullyQualifiedName("ToolWithoutInputs", "SampleToolkit"))
+    second = catalog.get_tool(FullyQualifiedName("ToolWithOnlyContext", "SampleToolkit"))
+    assert first.input_model is second.input_model
+    assert first.output_model is second.output_model
+    assert first.input_model(unexpected="value").model_dump() == {}
+
+
+def test_create_tool_definition_skips_source_check_for_annotated_return():
+    with patch(
+        "arcade.core.catalog.does_function_return_value", wraps=does_function_return_value
+    ) as mock_does_function_return_value:
+        ToolCatalog.create_tool_definition(sample_tool, "sample_toolkit")
+        ToolCatalog.create_tool_definition(tool_without_inputs, "sample_toolkit")
+
+    mock_does_function_return_value.assert_called_once_with(tool_without_inputs)
+
+
+def test_add_toolkit_imports_each_module_once():
+    catalog = ToolCatalog()
+    toolkit = Toolkit(
+        name="sample_toolkit",
+        description="A sample toolkit",
+        version="1.0.0",
+        package_name="sample_toolkit",
+    )
+    toolkit.tools = {__name__: ["sample_tool", "tool_without_inputs"]}
+
+    with patch("arcade.core.catalog.import_module", wraps=import_module) as mock_import:
+        catalog.add_toolkit(toolkit)
+
+    mock_import.assert_called_once_with(__name__)
+    assert len(catalog) == 2
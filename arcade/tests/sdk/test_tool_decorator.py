@@ -1,4 +1,6 @@
 import asyncio
+import inspect
+from typing import Annotated
 
 import pytest
 
@@ -49,3 +51,25 @@ def test_tool_decorator_with_all_options():
     assert test_tool.__tool_name__ == "TestTool"
     assert test_tool.__tool_description__ == "Test description"
     assert test_tool.__tool_requires_auth__.scopes == ["test_scope", "another.scope"]
+
+
+def test_tool_decorator_precomputes_metadata():
+    @tool(desc="Test description")
+    def test_tool(x: Annotated[int, "The number"]) -> str:
+        return str(x)
+
+    assert test_tool.__tool_signature__ == inspect.signature(test_tool)
+    assert [p.name for p in test_tool.__tool_inputs__.parameters] == ["x"]
+    assert test_tool.__tool_output__.value_schema.val_type == "string"
+    assert test_tool.__tool_input_model__.__name__ == "TestToolInput"
+    assert test_tool.__tool_output_model__.__name__ == "TestToolOutput"
+
+
+def test_tool_decorator_skips_metadata_for_invalid_tool():
+    @tool
+    def test_tool(x, y):
+        return x + y
+
+    assert test_tool.__tool_signature__ == inspect.signature(test_tool)
+    assert not hasattr(test_tool, "__tool_inputs__")
+    assert not hasattr(test_tool, "__tool_input_model__")
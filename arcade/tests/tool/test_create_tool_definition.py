@@ -214,6 +214,11 @@ def func_with_optional_return() -> Optional[str]:
     return "maybe output"
 
 
+@tool(desc="A function with an optional return type using the | syntax")
+def func_with_pipe_optional_return() -> str | None:
+    return "maybe output"
+
+
 @tool(desc="A function with a complex return type")
 def func_with_complex_return() -> dict[str, str]:
     return [{"key": "value"}]
@@ -664,6 +669,18 @@ def func_with_complex_return() -> dict[str, str]:
             },
             id="func_with_optional_return",
         ),
+        pytest.param(
+            func_with_pipe_optional_return,
+            {
+                "inputs": ToolInputs(parameters=[]),
+                "output": ToolOutput(
+                    value_schema=ValueSchema(val_type="string", enum=None),
+                    available_modes=["value", "error", "null"],
+                    description="No description provided.",
+                ),
+            },
+            id="func_with_pipe_optional_return",
+        ),
         pytest.param(
             func_with_complex_return,
             {